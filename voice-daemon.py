@@ -1,53 +1,147 @@
 #!/usr/bin/env python3
 
 import subprocess
+import shutil
 import sys
-import tempfile
 import os
 import signal
 import threading
+import gc
+import queue
 import time
-import wave
-import struct
-import math
 import fcntl
+import json
+import socket
+import socketserver
 
+# Per-user runtime dir keeps other users from owning or answering the socket
+SOCKET_PATH = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or "/tmp", "voice-daemon.sock")
+SOCKET_TIMEOUT_SECONDS = 5
+
+
+def send_request(request, socket_path=SOCKET_PATH):
+    """Send a JSON request to the running daemon and return its response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(SOCKET_TIMEOUT_SECONDS)
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(request) + "\n").encode())
+        with sock.makefile("r") as reply:
+            return json.loads(reply.readline())
+
+
+def trigger():
+    """Ask the running daemon to start recording, returning an exit code"""
+    try:
+        response = send_request({"record": True})
+    except (OSError, ValueError) as e:
+        print(f"[Voice Daemon] ✗ Could not reach daemon at {SOCKET_PATH}: {e}")
+        return 1
+
+    if not response.get("ok"):
+        print(f"[Voice Daemon] ✗ {response.get('error', 'request failed')}")
+        return 1
+
+    print("[Voice Daemon] ✓ Recording started")
+    return 0
+
+
+# The --trigger client only needs the socket, so handle it before importing
+# pynput (which needs a display), numpy and PyAudio
+if __name__ == "__main__" and "--trigger" in sys.argv[1:]:
+    sys.exit(trigger())
+
+# faster-whisper (CTranslate2, ONNX Runtime, tokenizers) is imported lazily
+# in initialize_model to keep daemon startup fast
 try:
-    from faster_whisper import WhisperModel
     from pynput import keyboard
+    import numpy as np
     import pyaudio
 except ImportError as e:
-    print(f"Missing required dependency: {e.name}")
-    print("Please install dependencies: pip install faster-whisper pynput pyaudio")
+    # pynput raises ImportError without a name when no display is available
+    print(f"Missing required dependency: {e.name or e}")
+    print("Please install dependencies: pip install faster-whisper pynput pyaudio numpy")
     sys.exit(1)
 
 
 # Audio configuration constants
-CHUNK_SIZE = 8192
+CHUNK_SIZE = 1024
+# PortAudio performs best with power-of-two buffer sizes
+CAPTURE_CHUNK_SIZES = [256, 512, 1024]
 AUDIO_FORMAT = pyaudio.paInt16
 CHANNELS = 1
 SAMPLE_RATE = 16000
 SILENCE_THRESHOLD_RMS = 400
-SILENCE_DURATION_SECONDS = 5.0
+SILENCE_DURATION_SECONDS = 1.5
 MAX_RECORDING_DURATION_SECONDS = 3600
 MIN_VALID_TRANSCRIPTION_LENGTH = 3
 TYPING_DELAY_SECONDS = 0.3
 MIN_RECORDING_DURATION_SECONDS = 0.5
+SPEECH_PAD_SECONDS = 0.4
+AUDIO_QUEUE_TIMEOUT_SECONDS = 1.0
+TRANSCRIPTION_QUEUE_SIZE = 2
+BATCHED_TRANSCRIPTION_MIN_SECONDS = 30
+WARMUP_DURATION_SECONDS = 0.5
+PREFERRED_COMPUTE_TYPES = ["int8_float16", "int8"]
+CTRANSLATE2_DEFAULT_THREADS = 4
+CAPTURE_CPU = 0
+CAPTURE_NICENESS = -5
+TRANSCRIPTION_BATCH_SIZE = 8
+
+
+class TriggerRequestHandler(socketserver.StreamRequestHandler):
+    """Handle a single JSON-line request from a trigger client"""
+
+    # Don't let a client that never sends a newline hold a handler thread
+    timeout = SOCKET_TIMEOUT_SECONDS
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except OSError:
+            # Client timed out or disconnected
+            return
+        except ValueError:
+            response = {"ok": False, "error": "invalid request"}
+        else:
+            if isinstance(request, dict) and request.get("record"):
+                if self.server.voice_daemon.process_voice_input():
+                    response = {"ok": True}
+                else:
+                    response = {"ok": False, "error": "already recording"}
+            else:
+                response = {"ok": False, "error": "unknown request"}
+
+        self.wfile.write((json.dumps(response) + "\n").encode())
 
 
 class VoiceDaemon:
-    def __init__(self, model_size="small", hotkey="<ctrl>+<alt>+v", use_ydotool=False, model_cache_dir=None):
+    def __init__(self, model_size="small", hotkey="<ctrl>+<alt>+v", use_ydotool=False, model_cache_dir=None,
+                 accuracy=False, chunk_size=CHUNK_SIZE):
         self.model_size = model_size
+        self.accuracy = accuracy
         self.hotkey = hotkey
         self.use_ydotool = use_ydotool
+        self._typer = "ydotool" if use_ydotool else "xdotool"
         self.model_cache_dir = model_cache_dir or "/mnt/development/.whisper-cache"
+        # One thread per physical core (assuming SMT) for CTranslate2's GEMMs,
+        # never fewer than CTranslate2's own default of 4
+        self.cpu_threads = max(CTRANSLATE2_DEFAULT_THREADS, len(os.sched_getaffinity(0)) // 2)
         self.model = None
+        self.batched_model = None
+        # PortAudio is initialized once and reused; only streams are per-utterance
+        self._pa = None
         self.is_recording = False
+        self.recording_lock = threading.Lock()
         self.recording_thread = None
+        self.transcription_queue = queue.Queue(maxsize=TRANSCRIPTION_QUEUE_SIZE)
+        self.transcriber_thread = None
         self.pid_file = "/tmp/voice-daemon.pid"
+        self.socket_path = SOCKET_PATH
+        self.socket_server = None
+        self._priority_failures = set()
 
         # Audio settings for VAD
-        self.CHUNK = CHUNK_SIZE
+        self.CHUNK = chunk_size
         self.FORMAT = AUDIO_FORMAT
         self.CHANNELS = CHANNELS
         self.RATE = SAMPLE_RATE
@@ -55,189 +149,310 @@ class VoiceDaemon:
         self.SILENCE_DURATION = SILENCE_DURATION_SECONDS
         self.MAX_RECORDING_TIME = MAX_RECORDING_DURATION_SECONDS
 
+        # Sum-of-squares equivalent of the RMS threshold for a full chunk
+        self._silence_ss_threshold = (self.SILENCE_THRESHOLD ** 2) * self.CHUNK
+
     def initialize_model(self):
         if self.model is None:
+            try:
+                import ctranslate2
+                from faster_whisper import BatchedInferencePipeline, WhisperModel
+                from faster_whisper.vad import get_vad_model
+            except ImportError as e:
+                print(f"Missing required dependency: {e.name}")
+                print("Please install dependencies: pip install faster-whisper pynput pyaudio numpy")
+                sys.exit(1)
+
             # Create cache directory if it doesn't exist
             os.makedirs(self.model_cache_dir, exist_ok=True)
 
             print(f"[Voice Daemon] Loading Whisper {self.model_size} model...")
             print(f"[Voice Daemon] Cache dir: {self.model_cache_dir}")
+            print(f"[Voice Daemon] CPU threads: {self.cpu_threads}")
+
+            # Pick the best INT8 variant this CPU's kernels support
+            supported = ctranslate2.get_supported_compute_types("cpu")
+            compute_type = next((t for t in PREFERRED_COMPUTE_TYPES if t in supported), "default")
+            print(f"[Voice Daemon] Compute type: {compute_type}")
 
             self.model = WhisperModel(
                 self.model_size,
                 device="cpu",
-                compute_type="int8",
-                num_workers=4,
+                compute_type=compute_type,
+                cpu_threads=self.cpu_threads,
+                num_workers=1,
                 download_root=self.model_cache_dir
             )
+            # Decodes VAD-split chunks of long recordings in parallel
+            self.batched_model = BatchedInferencePipeline(model=self.model)
             print(f"[Voice Daemon] ✓ Model loaded!")
 
-    def get_rms(self, data):
-        """Calculate RMS (volume) of audio chunk"""
-        count = len(data) / 2
-        format = "%dh" % (count)
-        shorts = struct.unpack(format, data)
-        sum_squares = sum([sample ** 2 for sample in shorts])
-        rms = math.sqrt(sum_squares / count)
-        return rms
+            # Run a silent transcription so lazy kernel and buffer setup
+            # doesn't land on the first hotkey press
+            print(f"[Voice Daemon] Warming up model...")
+            warmup_audio = np.zeros(int(WARMUP_DURATION_SECONDS * self.RATE), dtype=np.float32)
+            segments, _ = self.model.transcribe(warmup_audio, language="pt", vad_filter=False)
+            list(segments)
+            # faster-whisper caches the Silero VAD session and (since 1.1.1)
+            # runs it with one ONNX Runtime thread, so it doesn't compete with
+            # CTranslate2's pool; create it now rather than on the first long
+            # recording
+            get_vad_model()
+            print(f"[Voice Daemon] ✓ Model ready!")
+
+    def _is_loud(self, chunk):
+        """Check if int16 audio chunk RMS is above the silence threshold"""
+        samples = chunk.astype(np.int64)
+        return int(samples.dot(samples)) > self._silence_ss_threshold
+
+    def get_audio(self):
+        """Return the shared PyAudio instance, creating it on first use"""
+        if self._pa is None:
+            self._pa = pyaudio.PyAudio()
+        return self._pa
+
+    def release_audio(self):
+        """Terminate the shared PyAudio instance"""
+        if self._pa is not None:
+            self._pa.terminate()
+            self._pa = None
+
+    def set_thread_priority(self, niceness, cpus=None):
+        """Adjust niceness and CPU affinity of the calling thread (per-thread on Linux)"""
+        # Each failure is reported once; it will fail the same way on every
+        # recording (e.g. unprivileged user service, restricted cpuset)
+        if cpus is not None and "affinity" not in self._priority_failures:
+            try:
+                os.sched_setaffinity(0, cpus)
+            except (AttributeError, OSError) as e:
+                self._priority_failures.add("affinity")
+                print(f"[Voice Daemon] ⚠️  Could not set CPU affinity {cpus}: {e}")
+
+        if "nice" not in self._priority_failures:
+            try:
+                os.nice(niceness)
+            except OSError as e:
+                # Raising priority needs CAP_SYS_NICE or RLIMIT_NICE headroom
+                self._priority_failures.add("nice")
+                print(f"[Voice Daemon] ⚠️  Could not adjust thread priority: {e}")
 
     def record_audio(self):
-        """Record audio until silence is detected"""
-        audio = pyaudio.PyAudio()
+        """Record audio until silence is detected, returning float32 PCM samples"""
+        # PortAudio thread only enqueues raw chunks; VAD runs in this thread
+        chunk_queue = queue.Queue()
+        overflowed = threading.Event()
+
+        def on_audio(in_data, frame_count, time_info, status):
+            if status & pyaudio.paInputOverflow:
+                overflowed.set()
+            chunk_queue.put(in_data)
+            return (None, pyaudio.paContinue)
+
+        stream = self.get_audio().open(
+            format=self.FORMAT,
+            channels=self.CHANNELS,
+            rate=self.RATE,
+            input=True,
+            frames_per_buffer=self.CHUNK,
+            stream_callback=on_audio
+        )
 
-        try:
-            # Get sample width early before stream closes
-            sample_width = audio.get_sample_size(self.FORMAT)
-
-            stream = audio.open(
-                format=self.FORMAT,
-                channels=self.CHANNELS,
-                rate=self.RATE,
-                input=True,
-                frames_per_buffer=self.CHUNK
-            )
+        print("[Voice Daemon] 🎤 Fale agora...")
+        self.show_notification("Voice Input", "🎤 Fale agora...", "low")
 
-            print("[Voice Daemon] 🎤 Fale agora...")
-            self.show_notification("Voice Input", "🎤 Fale agora...", "low")
+        silence_chunks = 0
+        max_silence_chunks = int(self.SILENCE_DURATION * self.RATE / self.CHUNK)
+        started_speaking = False
+        min_recording_chunks = int(MIN_RECORDING_DURATION_SECONDS * self.RATE / self.CHUNK)
+        max_recording_chunks = int(self.MAX_RECORDING_TIME * self.RATE / self.CHUNK)
 
-            frames = []
-            silence_chunks = 0
-            max_silence_chunks = int(self.SILENCE_DURATION * self.RATE / self.CHUNK)
-            started_speaking = False
-            min_recording_chunks = int(MIN_RECORDING_DURATION_SECONDS * self.RATE / self.CHUNK)
+        # Write samples straight into one buffer sized for the longest
+        # recording; pages are only committed as they are written
+        buffer = np.empty((max_recording_chunks + 1) * self.CHUNK, dtype=np.int16)
+        num_samples = 0
+        num_chunks = 0
+        # Sample range covered by loud chunks, used to trim silence
+        speech_start = 0
+        speech_end = 0
 
-            try:
-                while True:
-                    data = stream.read(self.CHUNK, exception_on_overflow=False)
-                    frames.append(data)
-
-                    rms = self.get_rms(data)
-
-                    if rms > self.SILENCE_THRESHOLD:
-                        started_speaking = True
-                        silence_chunks = 0
-                        print(".", end="", flush=True)
-                    else:
-                        if started_speaking:
-                            silence_chunks += 1
-
-                    if started_speaking and silence_chunks > max_silence_chunks:
-                        if len(frames) > min_recording_chunks:
-                            print(f"\n[Voice Daemon] Silêncio detectado após {self.SILENCE_DURATION}s")
-                            break
-
-                    # Check max recording time
-                    if len(frames) > int(self.MAX_RECORDING_TIME * self.RATE / self.CHUNK):
-                        print(f"\n[Voice Daemon] Tempo máximo atingido ({self.MAX_RECORDING_TIME}s)")
+        try:
+            while True:
+                try:
+                    data = chunk_queue.get(timeout=AUDIO_QUEUE_TIMEOUT_SECONDS)
+                except queue.Empty:
+                    if not stream.is_active():
+                        print("\n[Voice Daemon] ⚠️  Audio stream stopped unexpectedly")
                         break
+                    continue
+
+                chunk = np.frombuffer(data, dtype=np.int16)
+                buffer[num_samples:num_samples + len(chunk)] = chunk
+                num_samples += len(chunk)
+                num_chunks += 1
+
+                if self._is_loud(chunk):
+                    if not started_speaking:
+                        speech_start = num_samples - len(chunk)
+                    speech_end = num_samples
+                    started_speaking = True
+                    silence_chunks = 0
+                    print(".", end="", flush=True)
+                else:
+                    if started_speaking:
+                        silence_chunks += 1
 
-            except KeyboardInterrupt:
-                pass
-            finally:
-                stream.stop_stream()
-                stream.close()
+                if started_speaking and silence_chunks > max_silence_chunks:
+                    if num_chunks > min_recording_chunks:
+                        print(f"\n[Voice Daemon] Silêncio detectado após {self.SILENCE_DURATION}s")
+                        break
+
+                # Check max recording time
+                if num_chunks > max_recording_chunks:
+                    print(f"\n[Voice Daemon] Tempo máximo atingido ({self.MAX_RECORDING_TIME}s)")
+                    break
+
+        except KeyboardInterrupt:
+            pass
         finally:
-            audio.terminate()
+            stream.stop_stream()
+            stream.close()
+
+        if overflowed.is_set():
+            print("[Voice Daemon] ⚠️  Audio input overflowed; some audio was dropped")
 
         if not started_speaking:
             return None
 
-        # Use secure temporary file creation
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            output_file = temp_file.name
+        # Drop the silence before the first and after the last loud chunk,
+        # which Whisper tends to fill with hallucinated text
+        pad = int(SPEECH_PAD_SECONDS * self.RATE)
+        speech = buffer[max(0, speech_start - pad):min(num_samples, speech_end + pad)]
 
-        with wave.open(output_file, 'wb') as wf:
-            wf.setnchannels(self.CHANNELS)
-            wf.setsampwidth(sample_width)
-            wf.setframerate(self.RATE)
-            wf.writeframes(b''.join(frames))
+        # Whisper expects mono float32 samples in [-1, 1]
+        pcm = speech.astype(np.float32) / 32768.0
 
-        duration = len(frames) * self.CHUNK / self.RATE
+        duration = len(pcm) / self.RATE
         print(f"[Voice Daemon] Gravado: {duration:.1f}s")
 
-        return output_file
+        return pcm
 
-    def transcribe(self, audio_file):
-        """Transcribe audio file to text"""
+    def transcribe(self, pcm):
+        """Transcribe float32 PCM samples, yielding text segment by segment"""
         self.initialize_model()
 
-        segments, info = self.model.transcribe(
-            audio_file,
-            language="pt",
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters={
+        # Greedy decoding is much faster for short dictation; --accuracy
+        # restores beam search
+        if self.accuracy:
+            decode_options = {"beam_size": 5}
+        else:
+            decode_options = {
+                "beam_size": 1,
+                "best_of": 1,
+                "temperature": 0,
+                "condition_on_previous_text": False
+            }
+
+        # Recordings longer than one Whisper window are split by VAD and
+        # the chunks decoded as a batch. Short recordings were already
+        # trimmed to the loud chunks in record_audio, so Silero VAD is
+        # skipped for them.
+        if len(pcm) > BATCHED_TRANSCRIPTION_MIN_SECONDS * self.RATE:
+            transcriber = self.batched_model
+            decode_options.pop("condition_on_previous_text", None)
+            decode_options["batch_size"] = TRANSCRIPTION_BATCH_SIZE
+            decode_options["vad_filter"] = True
+            decode_options["vad_parameters"] = {
                 "threshold": 0.3,  # Lower threshold - more sensitive
                 "min_speech_duration_ms": 200,  # Minimum 200ms of speech
                 "min_silence_duration_ms": 500,  # 500ms silence = end of speech
                 "speech_pad_ms": 400  # Add padding around speech
             }
+        else:
+            transcriber = self.model
+            decode_options["vad_filter"] = False
+
+        segments, info = transcriber.transcribe(
+            pcm,
+            language="pt",
+            **decode_options
         )
 
-        text = " ".join([segment.text.strip() for segment in segments])
-        return text.strip()
+        # Yield segments as CTranslate2 decodes them so typing can start
+        # before the whole recording is transcribed
+        for segment in segments:
+            segment_text = segment.text.strip()
+            if segment_text:
+                yield segment_text
 
-    def type_text_ydotool(self, text):
+    def type_text_ydotool(self, text, press_enter=True, delay=TYPING_DELAY_SECONDS):
         """Type text using ydotool (works with Wayland and X11)"""
-        if not text:
-            return
+        # A trailing newline is typed as Enter, avoiding a separate key call
+        keys = text + "\n" if press_enter else text
+        if not keys:
+            return True
 
         try:
-            # Check if ydotool is available
-            subprocess.run(["which", "ydotool"], check=True, capture_output=True)
-
             # Small delay
-            time.sleep(TYPING_DELAY_SECONDS)
+            time.sleep(delay)
 
-            # Type the text
             subprocess.run(
-                ["ydotool", "type", text],
+                ["ydotool", "type", "--key-delay", "1", keys],
                 check=True
             )
 
-            # Press Enter
-            subprocess.run(["ydotool", "key", "28:1", "28:0"], check=True)
-
             print(f"[Voice Daemon] ✓ Typed (ydotool): {text[:50]}...")
             return True
 
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
 
-    def type_text_xdotool(self, text):
+    def type_text_xdotool(self, text, press_enter=True, delay=TYPING_DELAY_SECONDS):
         """Type text using xdotool (X11 only)"""
-        if not text:
-            return
+        # A trailing newline is typed as Return, avoiding a separate key call
+        keys = text + "\n" if press_enter else text
+        if not keys:
+            return True
 
         try:
-            time.sleep(TYPING_DELAY_SECONDS)
+            time.sleep(delay)
 
             subprocess.run(
-                ["xdotool", "type", "--delay", "10", "--", text],
+                ["xdotool", "type", "--delay", "1", "--", keys],
                 check=True
             )
 
-            subprocess.run(["xdotool", "key", "Return"], check=True)
-
             print(f"[Voice Daemon] ✓ Typed (xdotool): {text[:50]}...")
             return True
 
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
 
-    def type_text(self, text):
-        """Type text using available tool"""
-        # Always try xdotool first (more reliable)
-        if not self.type_text_xdotool(text):
-            print("[Voice Daemon] ⚠️  xdotool failed, trying ydotool")
-            if not self.type_text_ydotool(text):
-                print("[Voice Daemon] ✗ Both xdotool and ydotool failed")
-                # Fallback: copy to clipboard
-                try:
-                    subprocess.run(["xclip", "-selection", "clipboard"], input=text.encode(), check=True, timeout=5)
-                    print("[Voice Daemon] ✓ Copied to clipboard as fallback")
-                except (subprocess.SubprocessError, FileNotFoundError, OSError) as e:
-                    print(f"[Voice Daemon] ✗ All typing methods failed: {e}")
+    def type_text(self, text, press_enter=True, delay=TYPING_DELAY_SECONDS):
+        """Type text using available tool, returns False if no tool worked"""
+        typers = {
+            "xdotool": self.type_text_xdotool,
+            "ydotool": self.type_text_ydotool,
+        }
+        fallback = "xdotool" if self._typer == "ydotool" else "ydotool"
+
+        # Use the tool detected at startup, then try the other one
+        if typers[self._typer](text, press_enter, delay):
+            return True
+
+        print(f"[Voice Daemon] ⚠️  {self._typer} failed, trying {fallback}")
+        if typers[fallback](text, press_enter, delay):
+            return True
+
+        print("[Voice Daemon] ✗ Both xdotool and ydotool failed")
+        return False
+
+    def copy_to_clipboard(self, text):
+        """Copy text to the clipboard as a fallback when typing fails"""
+        try:
+            subprocess.run(["xclip", "-selection", "clipboard"], input=text.encode(), check=True, timeout=5)
+            print("[Voice Daemon] ✓ Copied to clipboard as fallback")
+        except (subprocess.SubprocessError, FileNotFoundError, OSError) as e:
+            print(f"[Voice Daemon] ✗ All typing methods failed: {e}")
 
     def show_notification(self, title, message, urgency="normal"):
         """Show desktop notification"""
@@ -251,31 +466,73 @@ class VoiceDaemon:
             # Notifications are non-critical, silently continue
             pass
 
+    def transcription_worker(self):
+        """Transcribe recorded utterances handed off by the recording thread"""
+        while True:
+            pcm = self.transcription_queue.get()
+
+            try:
+                print("[Voice Daemon] 🔄 Transcribing...")
+                self.show_notification("Voice Input", "🔄 Transcribing...", "low")
+
+                text = ""
+                typed_length = 0
+                typing_failed = False
+
+                for segment_text in self.transcribe(pcm):
+                    # Type what came before this segment and hold the newest one
+                    # back, so the last chunk is typed together with Enter. Very
+                    # short output is also held until it's clearly not noise.
+                    if not typing_failed and len(text) > MIN_VALID_TRANSCRIPTION_LENGTH:
+                        # Only the first chunk needs to wait for the hotkey release
+                        delay = TYPING_DELAY_SECONDS if typed_length == 0 else 0
+                        if self.type_text(text[typed_length:], press_enter=False, delay=delay):
+                            typed_length = len(text)
+                        else:
+                            typing_failed = True
+
+                    text = f"{text} {segment_text}" if text else segment_text
+
+                if len(text) > MIN_VALID_TRANSCRIPTION_LENGTH:
+                    print(f"[Voice Daemon] 📝 Transcribed: {text}")
+                    if not typing_failed:
+                        delay = TYPING_DELAY_SECONDS if typed_length == 0 else 0
+                        typing_failed = not self.type_text(text[typed_length:], press_enter=True, delay=delay)
+                    if typing_failed:
+                        self.copy_to_clipboard(text)
+                    self.show_notification("Voice Input", f"✓ {text[:50]}", "normal")
+                else:
+                    print("[Voice Daemon] ⚠️  Nenhuma fala detectada")
+                    self.show_notification("Voice Input", "⚠️ Nenhuma fala detectada", "normal")
+
+            except Exception as e:
+                print(f"[Voice Daemon] ✗ Error: {e}")
+                self.show_notification("Voice Input", f"✗ Error: {str(e)}", "critical")
+            finally:
+                self.transcription_queue.task_done()
+
     def process_voice_input(self):
-        """Process voice input in a separate thread"""
-        if self.is_recording:
-            return
+        """Record voice input in a separate thread and queue it for transcription.
+
+        Returns False if a recording is already in progress.
+        """
+        # Hotkey and socket requests arrive on different threads
+        with self.recording_lock:
+            if self.is_recording:
+                return False
+            self.is_recording = True
 
-        self.is_recording = True
+        def record_and_enqueue():
+            # Keep capture responsive on a busy desktop
+            self.set_thread_priority(CAPTURE_NICENESS, {CAPTURE_CPU})
 
-        def record_and_transcribe():
             try:
-                audio_file = self.record_audio()
-
-                if audio_file:
-                    print("[Voice Daemon] 🔄 Transcribing...")
-                    self.show_notification("Voice Input", "🔄 Transcribing...", "low")
-
-                    text = self.transcribe(audio_file)
-                    os.unlink(audio_file)
-
-                    if text and len(text) > MIN_VALID_TRANSCRIPTION_LENGTH:
-                        print(f"[Voice Daemon] 📝 Transcribed: {text}")
-                        self.type_text(text)
-                        self.show_notification("Voice Input", f"✓ {text[:50]}", "normal")
-                    else:
-                        print("[Voice Daemon] ⚠️  Nenhuma fala detectada")
-                        self.show_notification("Voice Input", "⚠️ Nenhuma fala detectada", "normal")
+                pcm = self.record_audio()
+
+                if pcm is not None:
+                    # Blocks while the transcriber is backed up, so no new
+                    # recording starts until there is room in the queue
+                    self.transcription_queue.put(pcm)
                 else:
                     print("[Voice Daemon] ⚠️  Sem áudio gravado")
                     self.show_notification("Voice Input", "⚠️ Nenhuma fala detectada", "normal")
@@ -286,14 +543,43 @@ class VoiceDaemon:
             finally:
                 self.is_recording = False
 
-        self.recording_thread = threading.Thread(target=record_and_transcribe)
+        self.recording_thread = threading.Thread(target=record_and_enqueue)
         self.recording_thread.start()
+        return True
 
     def on_activate(self):
         """Called when hotkey is pressed"""
         print(f"[Voice Daemon] Hotkey triggered!")
         self.process_voice_input()
 
+    def start_socket_server(self):
+        """Accept trigger requests from other tools so they share the loaded model"""
+        try:
+            # We hold the PID lock, so any existing socket is stale
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self.socket_server = socketserver.ThreadingUnixStreamServer(self.socket_path, TriggerRequestHandler)
+            os.chmod(self.socket_path, 0o600)
+        except OSError as e:
+            print(f"[Voice Daemon] ⚠️  Failed to create socket {self.socket_path}: {e}")
+            self.socket_server = None
+            return
+
+        self.socket_server.daemon_threads = True
+        self.socket_server.voice_daemon = self
+        threading.Thread(target=self.socket_server.serve_forever, daemon=True).start()
+
+    def stop_socket_server(self):
+        """Stop accepting trigger requests and remove the socket"""
+        if self.socket_server is not None:
+            self.socket_server.shutdown()
+            self.socket_server.server_close()
+            self.socket_server = None
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
     def write_pid(self):
         """Write PID to file with exclusive lock to prevent multiple instances"""
         try:
@@ -323,32 +609,45 @@ class VoiceDaemon:
         """Start the daemon"""
         self.write_pid()
 
-        # Detect which tool to use
-        try:
-            subprocess.run(["which", "ydotool"], check=True, capture_output=True)
-            self.use_ydotool = True
-            tool_name = "ydotool (Wayland/X11)"
-        except:
-            tool_name = "xdotool (X11)"
+        # Detect which tool to use once, instead of probing on every utterance
+        if not self.use_ydotool:
+            self.use_ydotool = shutil.which("ydotool") is not None
+
+        self._typer = "ydotool" if self.use_ydotool else "xdotool"
+        tool_name = "ydotool (Wayland/X11)" if self.use_ydotool else "xdotool (X11)"
 
         print("=" * 60)
         print("🎙️  Voice Input Daemon Started (VAD Mode)")
         print("=" * 60)
         print(f"Hotkey: {self.hotkey}")
         print(f"Model: Whisper {self.model_size}")
+        print(f"Decoding: {'beam search (accuracy)' if self.accuracy else 'greedy (fast)'}")
         print(f"Typing tool: {tool_name}")
         print(f"Mode: Detecção de silêncio (para quando você parar)")
-        print(f"Silêncio: 5.0 segundos")
+        print(f"Silêncio: {self.SILENCE_DURATION} segundos")
         print(f"Máximo: 1 HORA de gravação contínua")
-        print(f"Buffer: 8192 chunks (otimizado para 64GB RAM)")
+        print(f"Buffer: {self.CHUNK} samples ({self.CHUNK * 1000 // self.RATE} ms por chunk)")
         print(f"PID: {os.getpid()}")
+        print(f"Socket: {self.socket_path} (trigger with --trigger)")
         print("=" * 60)
-        print("\nPressione hotkey e FALE - para automaticamente após 5s de silêncio")
+        print(f"\nPressione hotkey e FALE - para automaticamente após {self.SILENCE_DURATION}s de silêncio")
         print("Você pode falar por ATÉ 1 HORA continuamente!")
         print("Press Ctrl+C to stop the daemon\n")
 
-        # Initialize model on startup
+        # Initialize model and audio subsystem on startup
         self.initialize_model()
+        self.get_audio()
+
+        # Move the long-lived model objects out of the GC's tracked
+        # generations so collections stay short during capture
+        gc.collect()
+        gc.freeze()
+
+        self.start_socket_server()
+
+        # Transcribe in the background so the hotkey is free while decoding
+        self.transcriber_thread = threading.Thread(target=self.transcription_worker, daemon=True)
+        self.transcriber_thread.start()
 
         self.show_notification(
             "Voice Daemon (VAD)",
@@ -365,6 +664,8 @@ class VoiceDaemon:
         except KeyboardInterrupt:
             print("\n[Voice Daemon] Stopping...")
         finally:
+            self.stop_socket_server()
+            self.release_audio()
             self.remove_pid()
             self.show_notification("Voice Daemon", "Stopped", "low")
 
@@ -389,13 +690,37 @@ def main():
         action="store_true",
         help="Force use of ydotool instead of xdotool"
     )
+    parser.add_argument(
+        "--capture-chunk",
+        type=int,
+        default=CHUNK_SIZE,
+        choices=CAPTURE_CHUNK_SIZES,
+        help=f"Audio capture buffer in samples (default: {CHUNK_SIZE}); "
+             "smaller lowers latency, larger avoids overruns"
+    )
+    parser.add_argument(
+        "--accuracy",
+        action="store_true",
+        help="Use beam search decoding (slower, slightly more accurate)"
+    )
+    parser.add_argument(
+        "--trigger",
+        action="store_true",
+        help="Ask the running daemon to start recording, then exit"
+    )
 
     args = parser.parse_args()
 
-    daemon = VoiceDaemon(model_size=args.model, hotkey=args.hotkey, use_ydotool=args.ydotool)
+    if args.trigger:
+        sys.exit(trigger())
+
+    daemon = VoiceDaemon(model_size=args.model, hotkey=args.hotkey, use_ydotool=args.ydotool,
+                         accuracy=args.accuracy, chunk_size=args.capture_chunk)
 
     # Handle signals
     def signal_handler(sig, frame):
+        daemon.stop_socket_server()
+        daemon.release_audio()
         daemon.remove_pid()
         sys.exit(0)
 